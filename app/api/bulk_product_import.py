@@ -1,9 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, BackgroundTasks
 import time
-import pandas as pd
 from io import StringIO, BytesIO
 from app.db import engine
-from openpyxl import load_workbook
+from app.catalog import catalog
 import csv
 import tempfile
 
@@ -12,10 +11,13 @@ router = APIRouter()
 
 
 @router.post("/bulk-product-import/v5", summary="Bulk upload products from CSV or Excel")
-async def bulk_product_import(file: UploadFile = File(...)):
+async def bulk_product_import(background_tasks: BackgroundTasks, file: UploadFile = File(...)):
     start = time.perf_counter()
 
     if file.filename.endswith((".xls", ".xlsx")):
+        # pandas (and openpyxl behind read_excel) are only needed for Excel uploads
+        import pandas as pd
+
         # does not work here
         df = pd.read_excel(file.file)
         tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".csv")
@@ -37,15 +39,31 @@ async def bulk_product_import(file: UploadFile = File(...)):
         with conn.cursor() as cur:
             # cur.execute("SET work_mem = '256MB';")
 
+            # Stage the upload so its categories can be read back in SQL
+            cur.execute(
+                "CREATE TEMP TABLE product_import (LIKE product INCLUDING DEFAULTS) ON COMMIT DROP"
+            )
             cur.copy_expert(
                 """
-                COPY product(product_id, name, people, category, price, stock_quantity,
-                             manufacturer, description)
+                COPY product_import(product_id, name, people, category, price, stock_quantity,
+                                    manufacturer, description)
                 FROM STDIN WITH CSV HEADER
                 """,
                 csv_file,
             )
             imported_count = cur.rowcount
+
+            cur.execute(
+                """
+                INSERT INTO product(product_id, name, people, category, price, stock_quantity,
+                                    manufacturer, description)
+                SELECT product_id, name, people, category, price, stock_quantity,
+                       manufacturer, description
+                FROM product_import
+                """
+            )
+            cur.execute("SELECT DISTINCT category FROM product_import")
+            categories = {row[0] for row in cur.fetchall()}
         conn.commit()
     except Exception as e:
         conn.rollback()
@@ -53,6 +71,9 @@ async def bulk_product_import(file: UploadFile = File(...)):
     finally:
         conn.close()
 
+    # Rebuild the snapshots of the uploaded categories after the response is sent
+    background_tasks.add_task(catalog.refresh_categories, categories)
+
     end = time.perf_counter()
     return {
         "status": "success",
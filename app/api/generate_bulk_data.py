@@ -1,16 +1,26 @@
 import random
 import uuid
-import pandas as pd
 
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, BackgroundTasks
 from fastapi.responses import StreamingResponse, Response
-from typing import Literal
-from faker import Faker
+from typing import Literal, TYPE_CHECKING
 from io import BytesIO, StringIO
 from concurrent.futures import ThreadPoolExecutor
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 router = APIRouter()
-fake = Faker()
+_fake = None
+
+
+def get_fake():
+    """Faker is slow to import and build, so only do it on first use."""
+    global _fake
+    if _fake is None:
+        from faker import Faker
+        _fake = Faker()
+    return _fake
 
 
 @router.get(
@@ -70,8 +80,11 @@ async def generate_dataset(
         )
 
 
-def generate_product_data(num_rows: int) -> pd.DataFrame:
+def generate_product_data(num_rows: int) -> "pd.DataFrame":
     """Generates a Pandas DataFrame with dummy fashion/clothing product data."""
+    import pandas as pd
+
+    fake = get_fake()
     data = []
 
     categories = ["Shirt", "Jeans", "Footwear"]
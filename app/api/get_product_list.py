@@ -9,10 +9,27 @@ from app.models import Product
 from meilisearch.errors import MeilisearchApiError
 from app.meili import client 
 from app.typesense import client as tsClient
+from app.catalog import catalog
+from app.api.pagination import paginated_response
 
 
 
 router = APIRouter()
+
+
+def _catalog_page(start, page, page_size, search, people, category, min_price):
+    """Serve filter-only queries from the in-process snapshot, None if it can't."""
+    if search:
+        return None
+
+    snapshot = catalog.get(category)
+    if snapshot is None:
+        return None
+
+    products, total_items = snapshot.query(people, min_price, (page - 1) * page_size, page_size)
+    return paginated_response(start, page, page_size, products, total_items)
+
+
 # tsClient = typesense.Client({
 #   'nodes': [{ 'host': 'localhost', 'port': '8108', 'protocol': 'http' }],
 #   'api_key': 'sampleTypesenseKey'
@@ -165,6 +182,11 @@ async def get_product_list_v2(
             status_code=400,
             detail="'category' parameters is required."
         )
+
+    # Filter-only listing: answer locally without an engine round trip
+    cached = _catalog_page(start, page, page_size, search, people, category, min_price)
+    if cached is not None:
+        return cached
     
     try:
         # Try to get existing index
@@ -370,6 +392,10 @@ async def get_product_list_typesense_v2(
     if not category:
         raise HTTPException(status_code=400, detail="'category' is required.")
 
+    # Filter-only listing: answer locally without an engine round trip
+    cached = _catalog_page(start, page, page_size, search, people, category, min_price)
+    if cached is not None:
+        return cached
 
     # Check if collection exists
     try:
@@ -0,0 +1,224 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+import time
+from app.schemas import PaginatedResponse
+from app.db import get_session
+from typing import List, Optional
+from sqlmodel import Session, select
+from app.models import Product
+from meilisearch.errors import MeilisearchApiError
+from typesense.exceptions import ObjectNotFound
+from app.meili import client, index_exists
+from app.typesense import client as tsClient, collection_exists
+from app import shards
+from app.api.pagination import paginated_response
+
+
+# The v3 handlers are plain def so FastAPI runs them on its threadpool and
+# the blocking shard fan-out never stalls the event loop
+router = APIRouter()
+
+# Typesense rejects searches with a larger per_page
+TYPESENSE_MAX_PER_PAGE = 250
+
+
+def _load_documents(session: Session, category: str) -> List[dict]:
+    query = select(Product).where(
+        (Product.category.ilike(f"%{category}%")),
+    )
+    results = session.exec(query).all()
+
+    if not results:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No products found for category='{category}'."
+        )
+
+    documents = []
+    for product in results:
+        d = product.model_dump()
+        d["product_id"] = str(d["product_id"])
+        documents.append(d)
+    return documents
+
+
+def _meili_build_shard(index_name: str, documents: List[dict]) -> None:
+    create_task = client.create_index(index_name, {'primaryKey': 'product_id'})
+    client.wait_for_task(create_task.task_uid)
+
+    index = client.get_index(index_name)
+    filterable_task = index.update_filterable_attributes(['price', 'people'])
+    sortable_task = index.update_sortable_attributes(['price'])
+    searchable_task = index.update_searchable_attributes(['name', 'manufacturer', 'description'])
+
+    client.wait_for_task(filterable_task.task_uid)
+    client.wait_for_task(sortable_task.task_uid)
+    client.wait_for_task(searchable_task.task_uid)
+
+    if documents:
+        add_docs_task = index.add_documents(documents)
+        client.wait_for_task(add_docs_task.task_uid, timeout_in_ms=25000)
+
+    print(f"✅ {len(documents)} documents added to shard '{index_name}'")
+
+
+def _meili_delete_shard(index_name: str) -> None:
+    if index_exists(index_name):
+        client.wait_for_task(client.delete_index(index_name).task_uid)
+
+
+def _typesense_build_shard(index_name: str, documents: List[dict]) -> None:
+    schema = {
+        "name": index_name,
+        "fields": [
+            {"name": "product_id", "type": "string"},
+            {"name": "name", "type": "string"},
+            {"name": "people", "type": "string"},
+            {"name": "category", "type": "string"},
+            {"name": "price", "type": "float"},
+            {"name": "stock_quantity", "type": "int32"},
+            {"name": "manufacturer", "type": "string"},
+            {"name": "description", "type": "string"},
+        ],
+        "default_sorting_field": "price"
+    }
+
+    tsClient.collections.create(schema)
+    if documents:
+        tsClient.collections[index_name].documents.import_(documents, {'action': 'create'})
+
+    print(f"✅ {len(documents)} documents indexed in shard '{index_name}'")
+
+
+def _typesense_delete_shard(index_name: str) -> None:
+    if collection_exists(index_name):
+        tsClient.collections[index_name].delete()
+
+
+@router.post("/get-product-list/meilisearch/v3",
+    response_model=PaginatedResponse,
+    summary="Get a paginated, searchable, and filterable list of products (sharded)"
+)
+def get_product_list_meili_sharded(
+    page: int = Query(1, ge=1, description="Page number to retrieve."),
+    page_size: int = Query(10, ge=1, le=100, description="Number of items per page."),
+    search: Optional[str] = Query(None, description="Search term for product name or manufacturer."),
+    people: Optional[str] = Query(None, description="Filter by product user (case-insensitive)."),
+    category: Optional[str] = Query(None, description="Filter by categories."),
+    min_price: Optional[float] = Query(None, ge=0, description="Filter products with price greater than or equal to this value."),
+    session: Session = Depends(get_session)
+):
+    start = time.perf_counter()
+
+    if not category:
+        raise HTTPException(status_code=400, detail="'category' parameters is required.")
+
+    def ensure_layout():
+        return shards.ensure(
+            "meili", category, index_exists,
+            lambda: _load_documents(session, category),
+            _meili_build_shard, _meili_delete_shard,
+        )
+
+    filter_by = []
+    if min_price is not None:
+        filter_by.append(f"price >= {min_price}")
+    if people is not None:
+        filter_by.append(f'people = "{people}"')
+
+    # Every shard has to return the top offset + page_size hits to merge correctly
+    offset = (page - 1) * page_size
+    search_params = {
+        "limit": offset + page_size,
+        "offset": 0,
+        "filter": " AND ".join(filter_by),
+        "showRankingScore": True,
+    }
+    if not search:
+        search_params["sort"] = ["price:desc"]
+
+    def search_shard(index_name):
+        result = client.index(index_name).search(search or "", search_params)
+        return result.get("hits", []), result.get("estimatedTotalHits", 0)
+
+    if search:
+        key = lambda hit: hit.get("_rankingScore", 0)
+    else:
+        key = lambda hit: hit["price"]
+
+    def is_missing(e):
+        return isinstance(e, MeilisearchApiError) and e.code == "index_not_found"
+
+    results = shards.search("meili", category, ensure_layout, search_shard, is_missing)
+    hits, total_items = shards.gather(results, key, offset, page_size)
+
+    return paginated_response(start, page, page_size, hits, total_items)
+
+
+@router.post("/get-product-list/typesense/v3",
+    response_model=PaginatedResponse,
+    summary="Get paginated, searchable, filterable list of products (Typesense, sharded)"
+)
+def get_product_list_typesense_sharded(
+    page: int = Query(1, ge=1),
+    page_size: int = Query(10, ge=1, le=100),
+    search: Optional[str] = Query(None),
+    people: Optional[str] = Query(None),
+    category: Optional[str] = Query(None),
+    min_price: Optional[float] = Query(None, ge=0),
+    session: Session = Depends(get_session)
+):
+    start = time.perf_counter()
+
+    if not category:
+        raise HTTPException(status_code=400, detail="'category' is required.")
+
+    def ensure_layout():
+        return shards.ensure(
+            "typesense", category, collection_exists,
+            lambda: _load_documents(session, category),
+            _typesense_build_shard, _typesense_delete_shard,
+        )
+
+    filter_by = []
+    if min_price is not None:
+        filter_by.append(f"price:>={min_price}")
+    if people is not None:
+        filter_by.append(f'people:={people}')
+
+    # Every shard has to return the top offset + page_size hits to merge correctly
+    offset = (page - 1) * page_size
+    needed = offset + page_size
+    search_params = {
+        "q": search or "*",
+        "query_by": "name,manufacturer,description",
+        "filter_by": " && ".join(filter_by),
+        "per_page": min(needed, TYPESENSE_MAX_PER_PAGE),
+    }
+
+    def search_shard(index_name):
+        # Walk the shard in capped pages until enough hits are collected
+        hits, found, shard_page = [], 0, 1
+        while len(hits) < needed:
+            result = tsClient.collections[index_name].documents.search(
+                {**search_params, "page": shard_page}
+            )
+            batch = result.get("hits", [])
+            found = result.get("found", 0)
+            hits.extend(batch)
+            if len(batch) < search_params["per_page"]:
+                break
+            shard_page += 1
+        return hits[:needed], found
+
+    if search:
+        key = lambda hit: hit.get("text_match", 0)
+    else:
+        key = lambda hit: hit["document"]["price"]
+
+    def is_missing(e):
+        return isinstance(e, ObjectNotFound)
+
+    results = shards.search("typesense", category, ensure_layout, search_shard, is_missing)
+    hits, total_items = shards.gather(results, key, offset, page_size)
+
+    return paginated_response(start, page, page_size, [h["document"] for h in hits], total_items)
@@ -0,0 +1,25 @@
+from fastapi import HTTPException
+import time
+from app.schemas import PaginatedResponse
+
+
+def paginated_response(start: float, page: int, page_size: int, data: list, total_items: int) -> PaginatedResponse:
+    """Build the list response for one page, 404 if the page is past the end."""
+    total_pages = (total_items + page_size - 1) // page_size if total_items > 0 else 1
+
+    if page > total_pages and total_items > 0:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Page {page} does not exist. Last page is {total_pages}.",
+        )
+
+    end = time.perf_counter()
+
+    return PaginatedResponse(
+        page=page,
+        page_size=page_size,
+        total_items=total_items,
+        total_pages=total_pages,
+        time=round((end - start) * 1000, 2),
+        data=data,
+    )
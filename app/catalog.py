@@ -0,0 +1,223 @@
+import sys
+import threading
+import numpy as np
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlmodel import Session, select, func
+from app.db import engine
+from app.models import Product
+
+# Upper bound for all snapshots together. A category that would push the
+# total over this is skipped and keeps going to the search engine.
+MAX_SNAPSHOT_BYTES = 256 * 1024 * 1024
+
+# Rough per-row cost excluding text: the slotted record, six str headers,
+# the uuid text, float/int objects, the list slot and the three columns.
+ROW_OVERHEAD_BYTES = 525
+
+# Per-row share of the snapshot outside the record itself: the list slot
+# plus the float64/int32/int16 columns
+COLUMN_BYTES_PER_ROW = 8 + 8 + 4 + 2
+
+
+class ProductRow:
+    """Array-backed product record, lighter than a dict per row."""
+    __slots__ = (
+        "product_id", "name", "people", "category",
+        "price", "stock_quantity", "manufacturer", "description",
+    )
+
+    def __init__(self, product: Product):
+        self.product_id = str(product.product_id)
+        self.name = product.name
+        self.people = product.people
+        self.category = product.category
+        self.price = product.price
+        self.stock_quantity = product.stock_quantity
+        self.manufacturer = product.manufacturer
+        self.description = product.description
+
+    def to_dict(self) -> dict:
+        return {field: getattr(self, field) for field in self.__slots__}
+
+    def nbytes(self) -> int:
+        return sys.getsizeof(self) + sum(
+            sys.getsizeof(getattr(self, field)) for field in self.__slots__
+        )
+
+
+class CategorySnapshot:
+    """Columnar view of one category, rows kept sorted by price ascending."""
+
+    def __init__(self, rows: List[ProductRow], rows_nbytes: int):
+        rows.sort(key=lambda r: r.price)
+
+        people_codes: Dict[str, int] = {}
+        for r in rows:
+            people_codes.setdefault(r.people.lower(), len(people_codes))
+
+        self.people_codes = people_codes
+        self.price = np.fromiter((r.price for r in rows), dtype=np.float64, count=len(rows))
+        self.stock = np.fromiter((r.stock_quantity for r in rows), dtype=np.int32, count=len(rows))
+        self.people = np.fromiter(
+            (people_codes[r.people.lower()] for r in rows), dtype=np.int16, count=len(rows)
+        )
+        self.rows = rows
+
+        # Measured once here; rows_nbytes covers only the records themselves
+        self.nbytes = (
+            self.price.nbytes
+            + self.stock.nbytes
+            + self.people.nbytes
+            + sys.getsizeof(self.rows)
+            + rows_nbytes
+        )
+
+    def query(
+        self,
+        people: Optional[str],
+        min_price: Optional[float],
+        offset: int,
+        limit: int,
+    ) -> Tuple[List[dict], int]:
+        """Return one page (highest price first) and the total match count."""
+        lo = 0
+        if min_price is not None:
+            lo = int(np.searchsorted(self.price, min_price, side="left"))
+
+        if people is None:
+            total = len(self.rows) - lo
+            # Walk backwards from the end so the most expensive come first
+            hi = len(self.rows) - offset
+            start = max(hi - limit, lo)
+            indices = range(hi - 1, start - 1, -1) if hi > lo else range(0)
+        else:
+            code = self.people_codes.get(people.lower())
+            if code is None:
+                return [], 0
+            matches = np.flatnonzero(self.people[lo:] == code)[::-1] + lo
+            total = len(matches)
+            indices = matches[offset:offset + limit]
+
+        return [self.rows[i].to_dict() for i in indices], total
+
+
+class Catalog:
+    """In-process per-category snapshots for filter-only listing queries."""
+
+    def __init__(self, max_bytes: int = MAX_SNAPSHOT_BYTES):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._snapshots: Dict[str, CategorySnapshot] = {}
+        # Serialises refreshes so the budget check and the swap see the same total
+        self._lock = threading.Lock()
+
+    def get(self, category: str) -> Optional[CategorySnapshot]:
+        return self._snapshots.get(category.lower())
+
+    def _drop(self, key: str) -> None:
+        snapshot = self._snapshots.pop(key, None)
+        if snapshot is not None:
+            self.nbytes -= snapshot.nbytes
+
+    def _estimate(self, session: Session, condition) -> Tuple[int, int]:
+        """Row count and estimated snapshot size, without loading any rows."""
+        text_bytes = (
+            func.length(Product.name)
+            + func.length(Product.people)
+            + func.length(Product.category)
+            + func.length(Product.manufacturer)
+            + func.length(Product.description)
+        )
+        query = select(func.count(), func.coalesce(func.sum(text_bytes), 0)).where(condition)
+        count, total_text = session.exec(query).one()
+        return count, count * ROW_OVERHEAD_BYTES + total_text
+
+    def _load_rows(self, session: Session, condition, limit: int) -> Optional[Tuple[List[ProductRow], int]]:
+        """Stream rows into records, giving up as soon as they outgrow limit.
+
+        Returns the records and their own size; the columns and list are
+        counted by CategorySnapshot.
+        """
+        query = select(Product).where(condition).execution_options(yield_per=1000)
+        rows: List[ProductRow] = []
+        rows_nbytes = 0
+        for product in session.exec(query):
+            row = ProductRow(product)
+            rows_nbytes += row.nbytes()
+            if rows_nbytes + len(rows) * COLUMN_BYTES_PER_ROW > limit:
+                return None
+            rows.append(row)
+        return rows, rows_nbytes
+
+    def _skip(self, key: str) -> bool:
+        self._drop(key)
+        print(f"⚠️ Snapshot for '{key}' skipped, over memory budget")
+        return False
+
+    def refresh(self, session: Session, category: str) -> bool:
+        """Rebuild a single category and swap it in if it fits the budget."""
+        key = category.lower()
+        condition = Product.category.ilike(f"%{category}%")
+
+        with self._lock:
+            count, estimate = self._estimate(session, condition)
+            if not count:
+                self._drop(key)
+                return False
+
+            current = self._snapshots.get(key)
+            others = self.nbytes - (current.nbytes if current else 0)
+            if others + estimate > self.max_bytes:
+                return self._skip(key)
+
+            if self.nbytes + estimate > self.max_bytes:
+                # No room to hold the old and new snapshot side by side
+                self._drop(key)
+
+            loaded = self._load_rows(session, condition, self.max_bytes - self.nbytes)
+            if loaded is None:
+                return self._skip(key)
+
+            snapshot = CategorySnapshot(*loaded)
+            # The list can over-allocate past COLUMN_BYTES_PER_ROW, so check the real size
+            if self.nbytes + snapshot.nbytes > self.max_bytes:
+                return self._skip(key)
+
+            self._drop(key)
+            self._snapshots[key] = snapshot
+            self.nbytes += snapshot.nbytes
+
+        print(f"✅ Snapshot for '{key}' loaded ({len(snapshot.rows)} rows)")
+        return True
+
+    def refresh_categories(self, categories: Iterable[str]) -> None:
+        """Rebuild only the snapshots a set of changed categories can affect."""
+        changed = {c.lower() for c in categories}
+        # Concurrent refreshes add and remove keys, so copy them under the lock
+        with self._lock:
+            existing = list(self._snapshots)
+        # Snapshots match with ilike '%key%', so 'shirt' also covers 't-shirt'
+        keys = changed | {k for k in existing if any(k in c for c in changed)}
+
+        with Session(engine) as session:
+            for key in keys:
+                self.refresh(session, key)
+
+    def refresh_all(self, session: Session) -> None:
+        """Refresh category by category so readers never see a half-built view."""
+        categories = {c.lower() for c in session.exec(select(Product.category).distinct()).all()}
+        for category in categories:
+            self.refresh(session, category)
+
+        # Drop categories that no longer exist in the DB
+        with self._lock:
+            for key in set(self._snapshots) - categories:
+                self._drop(key)
+
+    def reload(self) -> None:
+        """Refresh every category with its own session, for startup."""
+        with Session(engine) as session:
+            self.refresh_all(session)
+
+
+catalog = Catalog()
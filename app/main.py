@@ -1,7 +1,8 @@
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from app.api import generate_bulk_data, bulk_product_import, get_product_list
+from app.api import generate_bulk_data, bulk_product_import, get_product_list, get_product_list_sharded
 from app.db import engine
+from app.warmup import warm_up
 from app.models import Product
 from sqlmodel import SQLModel
 
@@ -12,6 +13,8 @@ from sqlmodel import SQLModel
 async def lifespan(app: FastAPI):
     print("Application has started")
     SQLModel.metadata.create_all(engine)
+    app.state.startup_timings = warm_up()
+    print(f"Application is ready: {app.state.startup_timings}")
     yield
     print("Application is shutting down")
 
@@ -28,4 +31,5 @@ def root():
 
 app.include_router(generate_bulk_data.router)
 app.include_router(bulk_product_import.router)
-app.include_router(get_product_list.router)
\ No newline at end of file
+app.include_router(get_product_list.router)
+app.include_router(get_product_list_sharded.router)
\ No newline at end of file
@@ -1,5 +1,13 @@
 import meilisearch
+from meilisearch.errors import MeilisearchApiError
 from typing import BinaryIO 
 
 client = meilisearch.Client('http://localhost:7700', 'aSampleMasterKey')
 
+
+def index_exists(index_name: str) -> bool:
+    try:
+        client.get_index(index_name)
+        return True
+    except MeilisearchApiError:
+        return False
@@ -0,0 +1,180 @@
+import heapq
+import math
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# Most shards a single category is split into
+SHARD_COUNT = 4
+# A category gets one extra shard per this many products, up to SHARD_COUNT
+MIN_DOCS_PER_SHARD = 50000
+
+executor = ThreadPoolExecutor(max_workers=SHARD_COUNT * 2)
+
+# (engine, category) -> number of shard indexes it was built with.
+# Only ever set once a layout is known to be complete.
+layouts: Dict[Tuple[str, str], int] = {}
+
+# One lock per (engine, category) so concurrent cold requests build once
+_locks: Dict[Tuple[str, str], threading.Lock] = {}
+_locks_guard = threading.Lock()
+
+
+def shard_name(category: str, shard: int, num_shards: int) -> str:
+    # The layout size is part of the name so a partly built layout is never
+    # mistaken for a complete one
+    return f"{category.lower()}-shard-{shard}-of-{num_shards}".replace(" ", "-")
+
+
+def layout_names(category: str, num_shards: int) -> List[str]:
+    return [shard_name(category, i, num_shards) for i in range(num_shards)]
+
+
+def shard_count_for(num_docs: int) -> int:
+    """Small categories stay on a single shard, large ones spread out."""
+    return max(1, min(SHARD_COUNT, math.ceil(num_docs / MIN_DOCS_PER_SHARD)))
+
+
+def shard_for(product_id: str, num_shards: int) -> int:
+    # crc32 is stable across processes, unlike hash()
+    return zlib.crc32(product_id.encode()) % num_shards
+
+
+def partition(documents: List[dict], num_shards: int) -> List[List[dict]]:
+    shards: List[List[dict]] = [[] for _ in range(num_shards)]
+    for doc in documents:
+        shards[shard_for(doc["product_id"], num_shards)].append(doc)
+    return shards
+
+
+def discover(engine: str, category: str, exists: Callable[[str], bool]) -> Optional[int]:
+    """Find a complete shard layout for a category in the engine, if there is one."""
+    key = (engine, category.lower())
+    if key in layouts:
+        return layouts[key]
+
+    candidates = [(n, layout_names(category, n)) for n in range(1, SHARD_COUNT + 1)]
+    names = [name for _, layout in candidates for name in layout]
+    found = dict(zip(names, executor.map(exists, names)))
+
+    for num_shards, layout in candidates:
+        if all(found[name] for name in layout):
+            layouts[key] = num_shards
+            return num_shards
+
+    return None
+
+
+def build(
+    engine: str,
+    category: str,
+    documents: List[dict],
+    build_shard: Callable[[str, List[dict]], None],
+    delete_shard: Callable[[str], None],
+) -> int:
+    """Split documents across shards and build every shard in parallel.
+
+    If any shard fails the whole layout is deleted again, so it is rebuilt
+    from scratch next time instead of being served from a subset.
+    """
+    num_shards = shard_count_for(len(documents))
+    shards = partition(documents, num_shards)
+    names = layout_names(category, num_shards)
+
+    # Clear out whatever an earlier failed build may have left behind
+    list(executor.map(delete_shard, names))
+
+    try:
+        # list() so any failure in a shard build is raised here
+        list(executor.map(build_shard, names, shards))
+    except Exception:
+        layouts.pop((engine, category.lower()), None)
+        list(executor.map(delete_shard, names))
+        raise
+
+    layouts[(engine, category.lower())] = num_shards
+    return num_shards
+
+
+def _lock_for(key: Tuple[str, str]) -> threading.Lock:
+    with _locks_guard:
+        return _locks.setdefault(key, threading.Lock())
+
+
+def ensure(
+    engine: str,
+    category: str,
+    exists: Callable[[str], bool],
+    load_documents: Callable[[], List[dict]],
+    build_shard: Callable[[str, List[dict]], None],
+    delete_shard: Callable[[str], None],
+) -> int:
+    """Return the category's shard count, building the layout first if needed.
+
+    discover and build run under a per-category lock, so a request never sees
+    the shards of a build that is still in progress and two cold requests
+    never delete each other's shards.
+    """
+    key = (engine, category.lower())
+    if key in layouts:
+        return layouts[key]
+
+    with _lock_for(key):
+        num_shards = discover(engine, category, exists)
+        if num_shards is None:
+            print(f"❌ {engine} shards for '{category.lower()}' do not exist. Creating...")
+            documents = load_documents()
+            num_shards = build(engine, category, documents, build_shard, delete_shard)
+            print(f"✅ {len(documents)} documents split across {num_shards} {engine} shards")
+        return num_shards
+
+
+def forget(engine: str, category: str) -> None:
+    layouts.pop((engine, category.lower()), None)
+
+
+def search(
+    engine: str,
+    category: str,
+    ensure_layout: Callable[[], int],
+    search_shard: Callable[[str], Tuple[List[dict], int]],
+    is_missing: Callable[[Exception], bool],
+) -> List[Tuple[List[dict], int]]:
+    """Scatter a query over the category's shards.
+
+    If a shard turns out to be gone the cached layout is dropped and
+    rediscovered (or rebuilt) once before giving up.
+    """
+    try:
+        return scatter(layout_names(category, ensure_layout()), search_shard)
+    except Exception as e:
+        if not is_missing(e):
+            raise
+        forget(engine, category)
+        return scatter(layout_names(category, ensure_layout()), search_shard)
+
+
+def scatter(names: Iterable[str], search_shard: Callable[[str], Tuple[List[dict], int]]) -> List[Tuple[List[dict], int]]:
+    """Run the same query against every shard concurrently."""
+    return list(executor.map(search_shard, names))
+
+
+def gather(
+    results: List[Tuple[List[dict], int]],
+    key: Callable[[dict], float],
+    offset: int,
+    limit: int,
+) -> Tuple[List[dict], int]:
+    """Merge per-shard top hits (each already sorted by key, descending) into one page."""
+    total = sum(found for _, found in results)
+    merged = heapq.merge(*(hits for hits, _ in results), key=key, reverse=True)
+
+    page = []
+    for i, hit in enumerate(merged):
+        if i >= offset + limit:
+            break
+        if i >= offset:
+            page.append(hit)
+
+    return page, total
@@ -4,3 +4,11 @@ client = typesense.Client({
   'nodes': [{ 'host': 'localhost', 'port': '8108', 'protocol': 'http' }],
   'api_key': 'sampleTypesenseKey'
 })
+
+
+def collection_exists(name: str) -> bool:
+    try:
+        client.collections[name].retrieve()
+        return True
+    except Exception:
+        return False
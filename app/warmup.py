@@ -0,0 +1,84 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List
+from sqlmodel import Session, select, func
+from app.db import engine, POOL_SIZE
+from app.models import Product
+from app.meili import client, index_exists
+from app.typesense import client as tsClient, collection_exists
+from app.catalog import catalog
+from app import shards
+
+# How many of the largest categories get their indexes warmed before ready
+WARMUP_TOP_CATEGORIES = 3
+
+
+def open_db_pool() -> None:
+    """Check out every pooled connection once so they are opened and pinged."""
+    conns = [engine.connect() for _ in range(POOL_SIZE)]
+    for conn in conns:
+        conn.close()
+
+
+def check_search_engines() -> None:
+    """Fail fast if either engine is unreachable.
+
+    The Typesense client shares one requests.Session, so this also leaves a
+    pooled connection open. The Meilisearch client (0.37) sends every call
+    through module-level requests functions, so there is no Meili
+    connection to keep open and this is only a health check.
+    """
+    client.health()
+    tsClient.collections.retrieve()
+
+
+def top_categories(n: int) -> List[str]:
+    with Session(engine) as session:
+        query = (
+            select(Product.category)
+            .group_by(Product.category)
+            .order_by(func.count().desc())
+            .limit(n)
+        )
+        return list(session.exec(query).all())
+
+
+def warm_category(category: str) -> None:
+    """Touch the v2 index and v3 shards of a category so the first query is hot."""
+    if index_exists(category.lower()):
+        client.index(category.lower()).search("", {"limit": 1})
+    if collection_exists(category):
+        tsClient.collections[category].documents.search({"q": "*", "query_by": "name", "per_page": 1})
+
+    for engine_name, exists in (("meili", index_exists), ("typesense", collection_exists)):
+        if shards.discover(engine_name, category, exists) is None:
+            print(f"❌ No {engine_name} shards for '{category.lower()}' yet")
+
+
+def warm_indexes() -> None:
+    categories = top_categories(WARMUP_TOP_CATEGORIES)
+    # Own pool: warm_category waits on shards.executor, so sharing it could deadlock
+    with ThreadPoolExecutor(max_workers=max(1, len(categories))) as pool:
+        list(pool.map(warm_category, categories))
+    print(f"✅ Warmed indexes for {categories}")
+
+
+def _timed(timings: Dict[str, float], phase: str, fn: Callable[[], None]) -> None:
+    start = time.perf_counter()
+    try:
+        fn()
+    except Exception as e:
+        # A search engine being down should not keep the API from starting
+        print(f"❌ Warm-up phase '{phase}' failed: {e}")
+    timings[phase] = round((time.perf_counter() - start) * 1000, 2)
+    print(f"⏱️ {phase}: {timings[phase]} ms")
+
+
+def warm_up() -> Dict[str, float]:
+    """Run every startup phase in order and return the time taken per phase in ms."""
+    timings: Dict[str, float] = {}
+    _timed(timings, "db_pool", open_db_pool)
+    _timed(timings, "search_health", check_search_engines)
+    _timed(timings, "catalog", catalog.reload)
+    _timed(timings, "indexes", warm_indexes)
+    return timings